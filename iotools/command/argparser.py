@@ -3,8 +3,6 @@ from __future__ import annotations
 import argparse
 from typing import Any, Callable, TYPE_CHECKING
 
-import tabulate
-
 if TYPE_CHECKING:
     from .declarative import CommandHandler
     from .argument import Argument
@@ -28,6 +26,8 @@ class ArgParser(argparse.ArgumentParser):
         return str(formatter.format_help())
 
     def format_help(self) -> str:
+        import tabulate
+
         target_cols = ["name", "commandline_aliases", "type", "default", "nullable", "info", "choices", "conditions"]
 
         required_args, optional_args = [], []
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import enum
+import sys
 from decimal import Decimal
 from pathlib import Path
 from typing import Any, Callable, Generic, TypeVar, Union, Optional, Type, TYPE_CHECKING
@@ -25,21 +26,23 @@ E = TypeVar("E")
 class Argument(ReprMixin):
     """Class representing an argument (and its associated metadata) for the Command and Group classes to use."""
     _registry: dict[Type, Type[Argument]] = {}
+    _enum_values: dict[Type[Enum], tuple] = {}
+    _repr_fields: tuple[str, ...] = ("name", "aliases", "info", "default", "nullable", "required", "choices", "validator", "widget")
 
     validator_constructor: Type[Validator] = None
     type_affinity: Type = None
 
     def __init__(self, name: str = None, aliases: list[str] = None, info: str = None, default: Any = None, nullable: bool = False,
                  conditions: Union[Callable, list[Callable], dict[str, Callable]] = None, choices: Union[Type[Enum], list] = None) -> None:
-        self.name, self.aliases, self.info, self.nullable = name, aliases, info, nullable
+        self.name = name
+        self.aliases = aliases
+        self.info = info
+        self.nullable = nullable
         self.default = self._value = default
         self.required = self.default is None and not self.nullable
 
-        self.choices: list = [member.value for member in choices] if Enum.is_enum(choices) else choices
-        self.validator = self.validator_constructor(nullable=bool(self.nullable)).set_choices(self.choices)
-
-        if conditions:
-            self.validator.add_conditions(conditions) if isinstance(conditions, (list, dict)) else self.validator.add_condition(conditions)
+        self.choices: list = list(self._enum_values_of(choices)) if Enum.is_enum(choices) else choices
+        self.validator = self.validator_constructor(nullable=bool(self.nullable), choices=self.choices, conditions=conditions)
 
         self.widget: Optional[WidgetHandler] = None
 
@@ -47,7 +50,7 @@ class Argument(ReprMixin):
             Stack.commands[-1]._handler_.add_argument(self)
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({', '.join([f'{attr}={repr(val)}' for attr, val in self.__dict__.items() if not attr.startswith('_')])})"
+        return f"{type(self).__name__}({', '.join([f'{attr}={repr(getattr(self, attr))}' for attr in self._repr_fields])})"
 
     def __bool__(self) -> bool:
         return self.nullable or self.value is not None
@@ -69,16 +72,33 @@ class Argument(ReprMixin):
         self._value = self.validator.convert(val)
 
     @property
-    def aliases(self) -> list[str]:
-        return sorted([f"--{name}" if len(name) > 1 else f"-{name}" for name in self._aliases if name], key=len)
+    def aliases(self) -> tuple[str, ...]:
+        """The commandline forms of this argument's name and aliases, shortest first. Cached until the name changes or an alias is added."""
+        if self._commandline_aliases is None or self._aliased_name != self.name:
+            self._aliased_name = self.name
+            self._commandline_aliases = tuple(sorted([sys.intern(f"--{name}" if len(name) > 1 else f"-{name}") for name in {self.name, *self._aliases} if name], key=len))
+
+        return self._commandline_aliases
 
     @aliases.setter
     def aliases(self, val: list[str]) -> None:
-        self._aliases = {self.name, *(val or [])}
+        self._aliases, self._commandline_aliases = set(val or []), None
+
+    def add_alias(self, alias: str) -> None:
+        """Add an additional alias by which this argument can be passed on the commandline."""
+        self._aliases.add(alias)
+        self._commandline_aliases = None
 
     def _post_init_hook(self) -> None:
         pass
 
+    @classmethod
+    def _enum_values_of(cls, enum_: Type[Enum]) -> tuple:
+        if (values := cls._enum_values.get(enum_)) is None:
+            values = cls._enum_values[enum_] = tuple(member.value for member in enum_)
+
+        return values
+
     @classmethod
     def infer_subclass(cls, mystery: Type) -> Type[Argument]:
         if (arg_class := cls._registry.get(mystery)) is not None:
@@ -96,6 +116,8 @@ class ParametrizableArgument(Argument, ParametrizableMixin):
 
 
 class ParametrizableSizedArgument(ParametrizableArgument):
+    _repr_fields = (*ParametrizableArgument._repr_fields, "widget_magnitude")
+
     widget_magnitude: int = None
 
     def parametrize(self, param: int) -> ParametrizableSizedArgument:
@@ -108,6 +130,8 @@ class ParametrizableSizedArgument(ParametrizableArgument):
 
 
 class ParametrizableCollectionArgument(ParametrizableArgument):
+    _repr_fields = (*ParametrizableArgument._repr_fields, "deep_type")
+
     deep_type: Argument = None
 
     validator: ListValidator
@@ -120,6 +144,8 @@ class ParametrizableCollectionArgument(ParametrizableArgument):
 
 
 class ParametrizableMappingArgument(ParametrizableArgument):
+    _repr_fields = (*ParametrizableArgument._repr_fields, "key_type", "val_type")
+
     key_type: Argument = None
     val_type: Argument = None
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Optional, TYPE_CHECKING
+from typing import Any, Callable, Optional, Union, TYPE_CHECKING
 
+import itertools
 import string
+from weakref import WeakValueDictionary
 
 from subtypes import Dict
 
@@ -13,10 +15,13 @@ from .enums import RunMode
 from .hierarchy import Hierarchy
 
 if TYPE_CHECKING:
+    from pathmagic import File, Dir
     from .declarative import Command, Group
 
 
 class Handler:
+    _repr_fields: tuple[str, ...] = ("name", "arguments", "groups", "names")
+
     def __init__(self, name: str, parent: Handler = None) -> None:
         self.name, self.parent = name, parent
 
@@ -25,20 +30,27 @@ class Handler:
         self.names: set[str] = set()
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({', '.join([f'{attr}={repr(val)}' for attr, val in self.__dict__.items() if not attr.startswith('_')])})"
+        return f"{type(self).__name__}({', '.join([f'{attr}={repr(getattr(self, attr))}' for attr in self._repr_fields])})"
 
     def __bool__(self) -> bool:
-        return all([*self.arguments, *self.groups])
+        return all(itertools.chain(self.arguments, self.groups))
 
     def add_argument(self, argument: Argument) -> None:
         """Add a new Argument object to this CommandHandler. Passes on its arguments to the Argument constructor."""
         self.register_name(argument.name)
         self.arguments.append(argument)
+        self.invalidate_hierarchy()
 
     def add_group(self, group: GroupHandler) -> None:
         self.register_name(group.name)
         self.groups.append(group)
         group.parent = self
+        self.invalidate_hierarchy()
+
+    def invalidate_hierarchy(self) -> None:
+        """Discard any cached hierarchy built by this handler or its ancestors, so that it is rebuilt on the next call to process."""
+        if self.parent is not None:
+            self.parent.invalidate_hierarchy()
 
     def register_name(self, name: str) -> None:
         if not name.isidentifier():
@@ -57,38 +69,51 @@ class CommandHandler(Handler):
     """
     parent: CommandHandler
 
+    _initial_letters = frozenset(string.ascii_lowercase) - {"h"}
+    _repr_fields = (*Handler._repr_fields, "desc", "run_mode", "callback", "subhandlers", "command")
+    _paths: WeakValueDictionary[tuple[str, ...], Union[File, Dir]] = WeakValueDictionary()
+
     def __init__(self, name: str, desc: str = "", callback: Callable = None, run_mode: RunMode = RunMode.SMART, subtypes: bool = True, parent: CommandHandler = None, command: Command = None) -> None:
         super().__init__(name=name, parent=parent)
-        self.desc, self.run_mode, self.callback = desc, run_mode, callback
+        self.desc = desc
+        self.run_mode = run_mode
+        self.callback = callback
 
         self.subhandlers: list[CommandHandler] = []
         self.command = command
 
         self.hierarchy: Optional[Hierarchy] = None
 
-        self.remaining_letters = set(string.ascii_lowercase)
-        self.remaining_letters.discard("h")
-
-    def __repr__(self) -> str:
-        return f"{type(self).__name__}({', '.join([f'{attr}={repr(val)}' for attr, val in self.__dict__.items() if not attr.startswith('_')])})"
+        self.remaining_letters: Union[set[str], frozenset[str]] = self._initial_letters
 
     def add_argument(self, argument: Argument) -> None:
         """Add a new Argument object to this CommandHandler. Passes on its arguments to the Argument constructor."""
         super().add_argument(argument)
 
         if shortform := self.determine_shortform_alias(argument.name):
-            argument.aliases.append(shortform)
+            argument.add_alias(shortform)
 
     def add_subhandler(self, subhandler: CommandHandler) -> None:
         self.register_name(subhandler.name)
         self.subhandlers.append(subhandler)
         subhandler.parent = self
+        self.invalidate_hierarchy()
+
+    def invalidate_hierarchy(self) -> None:
+        self.hierarchy = None
+        super().invalidate_hierarchy()
 
     def process(self, *args: Any, **kwargs: Any) -> CommandHandler:
-        """Collect input using this CommandHandler's 'run_mode' and return a CallableDict holding the parsed arguments, coerced to appropriate python types."""
+        """
+        Collect input using this CommandHandler's 'run_mode' and return a CallableDict holding the parsed arguments, coerced to appropriate python types.
+        The handlers are validated and configured on every call, but the Hierarchy built from them is reused until an argument, group or subhandler is added.
+        """
         self.pre_validate()
         self.hierarchize()
-        self.hierarchy = Hierarchy(root_handler=self)
+
+        if self.hierarchy is None:
+            self.hierarchy = Hierarchy(root_handler=self)
+
         return self.hierarchy.choose_strategy(*args, **kwargs)
 
     def pre_validate(self) -> None:
@@ -111,7 +136,7 @@ class CommandHandler(Handler):
         if self.parent:
             self.config = self.parent.config
             self.root = self.parent.root
-            self.folder = self.parent.folder.new_dir(self.name)
+            self.folder = self._cached_new_dir(self.parent.folder, self.name)
 
             self.shared_namespace = self.parent.shared_namespace
         else:
@@ -120,7 +145,7 @@ class CommandHandler(Handler):
 
             self.shared_namespace = Dict()
 
-        self.latest = self.folder.new_file("latest", "pkl")
+        self.latest = self._cached_new_file(self.folder, "latest", "pkl")
 
     def save_latest_input_config(self, namespace: Dict) -> None:
         self.latest.write(namespace)
@@ -131,28 +156,48 @@ class CommandHandler(Handler):
         else:
             print(f"No prior configuration found for '{self.name}'")
 
+    @classmethod
+    def _cached_new_dir(cls, parent: Dir, name: str) -> Dir:
+        """Return the subdirectory 'name' of 'parent', reusing the Dir object of any live handler that already requested it."""
+        key = (str(parent), name)
+        if (folder := cls._paths.get(key)) is None:
+            folder = cls._paths[key] = parent.new_dir(name)
+
+        return folder
+
+    @classmethod
+    def _cached_new_file(cls, parent: Dir, name: str, extension: str) -> File:
+        """Return the file 'name.extension' within 'parent', reusing the File object of any live handler that already requested it."""
+        key = (str(parent), name, extension)
+        if (file := cls._paths.get(key)) is None:
+            file = cls._paths[key] = parent.new_file(name, extension)
+
+        return file
+
     def determine_shortform_alias(self, name: str) -> str:
         for char in name:
             if char.isalnum():
                 letter = char.lower()
                 if letter in self.remaining_letters:
+                    if isinstance(self.remaining_letters, frozenset):
+                        self.remaining_letters = set(self.remaining_letters)
+
                     self.remaining_letters.remove(letter)
                     return letter
 
 
 class GroupHandler(Handler):
+    _repr_fields = (*Handler._repr_fields, "group")
+
     def __init__(self, name: str, parent: Handler = None, group: Group = None) -> None:
         super().__init__(name=name, parent=parent)
         self.group = group
 
-    def __repr__(self) -> str:
-        return f"{type(self).__name__}({', '.join([f'{attr}={repr(val)}' for attr, val in self.__dict__.items() if not attr.startswith('_')])})"
-
     def __bool__(self) -> bool:
         from .declarative import ArgumentGroup
 
         if isinstance(self.group, ArgumentGroup.Exclusive):
-            return len([*filter(None, [*self.arguments, *self.groups])]) <= 1
+            return len([*itertools.islice(filter(None, itertools.chain(self.arguments, self.groups)), 2)]) <= 1
 
         return super().__bool__()
 
@@ -95,9 +95,10 @@ class Hierarchy:
         return ArgsGui(hierarchy=self, args=args, handler=self.determine_chosen_node(args, strict=False).handler).start().node
 
     def run_from_commandline(self, args: dict = None) -> Node:
-        self.root.parser = ArgParser(prog=self.root.handler.name, description=self.root.handler.desc, handler=self.root.handler)
-        self.root.parser.add_arguments_from_handler()
-        self.root.add_subparsers_recursively()
+        if self.root.parser is None:
+            self.root.parser = ArgParser(prog=self.root.handler.name, description=self.root.handler.desc, handler=self.root.handler)
+            self.root.parser.add_arguments_from_handler()
+            self.root.add_subparsers_recursively()
 
         node = vars(self.root.parser.parse_args()).get("_node_", self.root)
         # node.validate_argument_dependencies_ascending()
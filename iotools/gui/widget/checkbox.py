@@ -4,8 +4,6 @@ from typing import Any, Callable
 
 from PySide6 import QtCore, QtWidgets
 
-from maybe import Maybe
-
 from iotools.command.argument import BooleanArgument, DictionaryArgument
 
 from .base import WidgetHandler
@@ -28,7 +26,7 @@ class Checkbox(WidgetHandler):
         if command is not None:
             self.widget.clicked.connect(command)
 
-        self.state = Maybe(state).else_(False)
+        self.state = False if state is None else state
 
     def _configure(self) -> None:
         self.widget.setSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
@@ -4,8 +4,6 @@ from typing import Union
 
 from PySide6 import QtWidgets
 
-from maybe import Maybe
-
 from iotools.command.argument import IntegerArgument, FloatArgument
 
 from .base import WidgetHandler
@@ -30,7 +28,7 @@ class NumericEntry(WidgetHandler):
         return self.widget.value()
 
     def _set_state(self, val: Union[int, float]) -> None:
-        self.widget.setValue(Maybe(val).else_(0))
+        self.widget.setValue(0 if val is None else val)
 
 
 class IntEntry(NumericEntry):
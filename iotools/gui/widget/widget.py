@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from maybe import Maybe
-
 from iotools.command.argument import (
     Argument,
     StringArgument, BooleanArgument, IntegerArgument, FloatArgument,
@@ -65,7 +63,7 @@ class Widget:
         elif isinstance(arg, DictionaryArgument) and isinstance(arg.key_type, StringArgument) and isinstance(arg.val_type, BooleanArgument):
             handler = CheckBar(choices=arg.default)
         elif isinstance(arg, BooleanArgument):
-            handler = Button(state=Maybe(arg.default).else_(False))
+            handler = Button(state=False if arg.default is None else arg.default)
         elif isinstance(arg, IntegerArgument):
             handler = IntEntry(state=arg.default)
         elif isinstance(arg, FloatArgument):
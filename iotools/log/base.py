@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 import getpass
+import time
 from traceback import format_exc
 
-from maybe import Maybe
 from subtypes import DateTime
 from pathmagic import File, Dir, PathLike
 from miscutils import executed_within_user_tree
@@ -22,6 +22,8 @@ class Log(FileHandler):
     """
     A log class intended to provide an alternative FileHandler implementation to the logbook library with additional functionality.
     The first time it is opened it will log the current time and user.
+    Written records are buffered and only flushed to disk once 'flush_threshold' characters or 'flush_interval' seconds have accumulated,
+    immediately for records of level ERROR and above, and when the log is exited.
     """
 
     class LogLevel:
@@ -30,13 +32,19 @@ class Log(FileHandler):
     default_logger: Logger = critical.__self__
     default_logger.name = "main"
 
+    flush_threshold, flush_interval = 64*1024, 30.0
+
+    _lesser_delimiter, _greater_delimiter = "-"*200, "="*200
+    _level_prefixes: dict[tuple[str, str], str] = {}
+
     def __init__(self, filename: PathLike, mode="a", encoding: str = None, level: int = LogLevel.NOT_SET,
                  format_string: str = None, delay: bool = True, filter: Callable = None, bubble: bool = False) -> None:
         super().__init__(filename=filename, mode=mode, encoding=encoding, level=level,
                          format_string=format_string, delay=delay, filter=filter, bubble=bubble)
 
-        self.user = getpass.getuser()
         self.file = File.from_pathlike(filename)
+        self._user: Optional[str] = None
+        self._unflushed_chars, self._last_flush = 0, time.monotonic()
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({', '.join([f'{attr}={repr(val)}' for attr, val in self.__dict__.items() if not attr.startswith('_')])})"
@@ -52,8 +60,17 @@ class Log(FileHandler):
 
         self.goodbye()
         super().__exit__(ex_type, ex_value, ex_traceback)
+        self.flush()
         self.post_process()
 
+    @property
+    def user(self) -> str:
+        """The name of the user running this process. Only looked up the first time it is needed."""
+        if self._user is None:
+            self._user = getpass.getuser()
+
+        return self._user
+
     @property
     def format_string(self) -> None:
         return None
@@ -79,6 +96,22 @@ class Log(FileHandler):
                              f"\n{type(self).__name__}.{self.format_message.__name__}"
                              f"\n{type(self).__name__}.{self.format_message_line.__name__}")
 
+    def emit(self, record: LogRecord) -> None:
+        super().emit(record)
+        if record.level >= self.LogLevel.ERROR:
+            self.flush()
+
+    def write(self, item: str) -> None:
+        super().write(item)
+        self._unflushed_chars += len(item)
+
+    def should_flush(self) -> bool:
+        return self._unflushed_chars >= self.flush_threshold or time.monotonic() - self._last_flush >= self.flush_interval
+
+    def flush(self) -> None:
+        super().flush()
+        self._unflushed_chars, self._last_flush = 0, time.monotonic()
+
     def start(self) -> None:
         """Start this log's file using the default application for this type of file."""
         self.file.start()
@@ -87,12 +120,20 @@ class Log(FileHandler):
         if record.level == 100:
             return record.message
 
-        prefix = self.format_prefix(record=record)
-        lines = self.format_message(record=record).split("\n")
-        return "\n".join(f"{prefix}{self.format_message_line(record=record, line=line)}" for line in lines)
+        prefix, message = self.format_prefix(record=record), self.format_message(record=record)
+        if "\n" not in message:
+            return f"{prefix}{self.format_message_line(record=record, line=message)}"
+
+        if type(self).format_message_line is Log.format_message_line:
+            return prefix + message.replace("\n", f"\n{prefix}")
+
+        return "\n".join([f"{prefix}{self.format_message_line(record=record, line=line)}" for line in message.split("\n")])
 
     def format_prefix(self, record: LogRecord) -> str:
-        return f"{DateTime.from_datetime(record.time).to_isoformat(timespec='milliseconds')} | {record.channel}.{record.level_name.ljust(8)} | "
+        if (level_prefix := self._level_prefixes.get(key := (record.channel, record.level_name))) is None:
+            level_prefix = self._level_prefixes[key] = f" | {record.channel}.{record.level_name.ljust(8)} | "
+
+        return f"{record.time.isoformat(timespec='milliseconds')}{level_prefix}"
 
     def format_message(self, record: LogRecord) -> str:
         return record.message.strip()
@@ -101,8 +142,7 @@ class Log(FileHandler):
         return line
 
     def greeting(self):
-        self.debug(f"Process executed by user {self.user}")
-        self.delimiter_lesser()
+        self.debug(f"Process executed by user {self.user}\n{self._lesser_delimiter}")
 
     def goodbye(self):
         return self.delimiter_greater()
@@ -115,54 +155,57 @@ class Log(FileHandler):
         self.critical(format_exc())
 
     @classmethod
-    def trace(cls, text: Any) -> None:
-        cls.default_logger.trace(str(text))
+    def trace(cls, text: Any, *args: Any, **kwargs: Any) -> None:
+        cls.default_logger.trace(str(text), *args, **kwargs)
 
     @classmethod
-    def debug(cls, text: Any) -> None:
-        cls.default_logger.debug(str(text))
+    def debug(cls, text: Any, *args: Any, **kwargs: Any) -> None:
+        cls.default_logger.debug(str(text), *args, **kwargs)
 
     @classmethod
-    def info(cls, text: Any) -> None:
-        cls.default_logger.info(str(text))
+    def info(cls, text: Any, *args: Any, **kwargs: Any) -> None:
+        cls.default_logger.info(str(text), *args, **kwargs)
 
     @classmethod
-    def notice(cls, text: Any) -> None:
-        cls.default_logger.notice(str(text))
+    def notice(cls, text: Any, *args: Any, **kwargs: Any) -> None:
+        cls.default_logger.notice(str(text), *args, **kwargs)
 
     @classmethod
-    def warning(cls, text: Any) -> None:
-        cls.default_logger.warning(str(text))
+    def warning(cls, text: Any, *args: Any, **kwargs: Any) -> None:
+        cls.default_logger.warning(str(text), *args, **kwargs)
 
     @classmethod
-    def error(cls, text: Any) -> None:
-        cls.default_logger.error(str(text))
+    def error(cls, text: Any, *args: Any, **kwargs: Any) -> None:
+        cls.default_logger.error(str(text), *args, **kwargs)
 
     @classmethod
-    def critical(cls, text: Any) -> None:
-        cls.default_logger.critical(str(text))
+    def critical(cls, text: Any, *args: Any, **kwargs: Any) -> None:
+        cls.default_logger.critical(str(text), *args, **kwargs)
 
     @classmethod
-    def bare(cls, text: Any) -> None:
-        cls.default_logger.log(100, str(text))
+    def bare(cls, text: Any, *args: Any, **kwargs: Any) -> None:
+        cls.default_logger.log(100, str(text), *args, **kwargs)
 
     @classmethod
     def delimiter_lesser(cls) -> None:
         """Write a delimiter of hyphens to this log."""
-        cls.debug("-"*200)
+        cls.debug(cls._lesser_delimiter)
 
     @classmethod
     def delimiter_greater(cls) -> None:
         """Write a delimiter of equal signs to this log."""
-        cls.debug("="*200)
+        cls.debug(cls._greater_delimiter)
 
     @classmethod
     def from_details(cls, stem: str, extension: str = "log", dir: PathLike = None, datestamp: bool = True,
                      mode="a", encoding: str = None, level: int = LogLevel.NOT_SET,
                      format_string: str = None, delay: bool = True, filter: Callable = None, bubble: bool = False) -> Log:
         """Create a new Log from the given arguments."""
-        default_log_dir = Dir.from_appdata(systemwide=not executed_within_user_tree()).new_dir("python").new_dir("logs").new_dir(iotools.__name__).new_dir("misc")
-        logdir = Dir.from_pathlike(Maybe(dir).else_(default_log_dir))
+        if dir is None:
+            logdir = Dir.from_appdata(systemwide=not executed_within_user_tree()).new_dir("python").new_dir("logs").new_dir(iotools.__name__).new_dir("misc")
+        else:
+            logdir = Dir.from_pathlike(dir)
+
         file = logdir.new_file(f"{DateTime.today().to_filetag()}_{stem}" if datestamp else stem, extension)
 
         return cls(filename=file, mode=mode, encoding=encoding, level=level, format_string=format_string, delay=delay, filter=filter, bubble=bubble)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import os
+import sys
 from typing import Callable
-import inspect
 from contextlib import contextmanager
 from types import FrameType
 
@@ -23,28 +23,46 @@ class BaseNestedLog(Log):
                          format_string=format_string, delay=delay, filter=filter, bubble=bubble)
         self.indentation_token = indentation_token
         self.indent = True
+        self._prefix_cache: dict[tuple[bool, int], str] = {}
 
     def format_message_line(self, record: LogRecord, line: str) -> str:
-        return f"{self.indentation_token*self.indentation_level if self.indent else ''}{super().format_message_line(record=record, line=line)}"
+        if (prefix := self._prefix_cache.get(key := (self.indent, self.indentation_level))) is None:
+            prefix = self._prefix_cache[key] = self._intern(self.indentation_token*key[1] if key[0] else "")
+
+        return f"{prefix}{super().format_message_line(record=record, line=line)}"
+
+    @staticmethod
+    def _intern(prefix: str) -> str:
+        return sys.intern(prefix) if prefix.isascii() else prefix
 
     def greeting(self):
-        with self.no_indentation():
+        indent, self.indent = self.indent, False
+        try:
             super().greeting()
+        finally:
+            self.indent = indent
 
     def goodbye(self):
-        with self.no_indentation():
+        indent, self.indent = self.indent, False
+        try:
             super().goodbye()
+        finally:
+            self.indent = indent
 
     def handle_exception(self, exception: Exception) -> None:
-        with self.no_indentation():
+        indent, self.indent = self.indent, False
+        try:
             super().handle_exception(exception)
+        finally:
+            self.indent = indent
 
     @contextmanager
     def no_indentation(self) -> StackFrameLog:
-        indent = self.indent
-        self.indent = False
-        yield self
-        self.indent = indent
+        indent, self.indent = self.indent, False
+        try:
+            yield self
+        finally:
+            self.indent = indent
 
 
 class IndentationLog(BaseNestedLog):
@@ -63,6 +81,8 @@ class IndentationLog(BaseNestedLog):
 
 
 class StackFrameLog(BaseNestedLog):
+    _logbook_suffix = f"logbook{os.sep}base.py"
+
     def __init__(self, filename: PathLike, mode="a", encoding: str = None, level: int = Log.LogLevel.NOT_SET,
                  format_string: str = None, delay: bool = True, filter: Callable = None, bubble: bool = False,
                  indentation_token: str = "    ") -> None:
@@ -70,6 +90,7 @@ class StackFrameLog(BaseNestedLog):
                          format_string=format_string, delay=delay, filter=filter, bubble=bubble,
                          indentation_token=indentation_token)
         self.frames: list[FrameType] = []
+        self._filename_skip_cache: dict[str, bool] = {}
 
     def __enter__(self) -> StackFrameLog:
         self.frames.clear()
@@ -77,6 +98,7 @@ class StackFrameLog(BaseNestedLog):
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.frames.clear()
+        self._filename_skip_cache.clear()
         super().__exit__(exc_type, exc_val, exc_tb)
 
     def format(self, record: LogRecord) -> str:
@@ -96,8 +118,9 @@ class StackFrameLog(BaseNestedLog):
             self.frames.append(topmost_record_frame)
             return
 
-        for frame in self.frames[::-1]:
-            if frame not in record_frames:
+        record_frame_ids = {id(frame) for frame in record_frames}
+        for frame in reversed(self.frames):
+            if id(frame) not in record_frame_ids:
                 self.frames.pop()
             else:
                 if frame != topmost_record_frame:
@@ -105,6 +128,17 @@ class StackFrameLog(BaseNestedLog):
 
                 return
 
-    @classmethod
-    def true_frames(cls, frame: FrameType) -> list[FrameType]:
-        return [info.frame for info in inspect.getouterframes(frame) if not info.filename.endswith(f"logbook{os.sep}base.py")]
+    def true_frames(self, frame: FrameType) -> list[FrameType]:
+        """Return the frames of the stack starting at 'frame' (innermost first), excluding those belonging to logbook's own machinery."""
+        frames, skip_cache = [], self._filename_skip_cache
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if (skip := skip_cache.get(filename)) is None:
+                skip = skip_cache[filename] = filename.endswith(self._logbook_suffix)
+
+            if not skip:
+                frames.append(frame)
+
+            frame = frame.f_back
+
+        return frames
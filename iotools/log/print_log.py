@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import Any, Callable
 
-from subtypes import Str
 from pathmagic import PathLike
 from miscutils import StdOutReplacerMixin
 
@@ -20,7 +19,9 @@ class StdOutLogRedirector(StdOutReplacerMixin):
 
 
 class PrintLog(Log):
-    """A subclass of Log directed at capturing the sys.stdout stream and logging it, in addition to still writing to sys.stdout (though this can be controlled with arguments)."""
+    """
+    A subclass of Log directed at capturing the sys.stdout stream and logging it, in addition to still writing to sys.stdout (though this can be controlled with arguments).
+    """
 
     def __init__(self, filename: PathLike, mode="a", encoding: str = None, level: int = Log.LogLevel.NOT_SET,
                  format_string: str = None, delay: bool = True, filter: Callable = None, bubble: bool = False) -> None:
@@ -41,15 +42,12 @@ class PrintLog(Log):
         from iotools import Console
 
         if (clear_line := f"{Console.UP_ONE_LINE}{Console.CLEAR_CURRENT_LINE}") in (text := self.file.content):
-            lines, escaped_clear_line, out_lines, skip_counter = reversed(text.split("\n")), Str(clear_line).re.escape(), [], 0
-            for index, line in enumerate(lines):
-                num_to_clear = line.count(clear_line)
-                if skip_counter:
-                    skip_counter -= 1
-                else:
-                    out_lines.append(Str(line).slice.after_last(escaped_clear_line) if num_to_clear else line)
-
-                if num_to_clear:
-                    skip_counter = max([skip_counter, num_to_clear])
-
-            self.file.content = "\n".join(reversed(out_lines))
+            out_lines = []
+            for line in text.split("\n"):
+                if num_to_clear := line.count(clear_line):
+                    del out_lines[-num_to_clear:]
+                    line = line.rpartition(clear_line)[2]
+
+                out_lines.append(line)
+
+            self.file.content = "\n".join(out_lines)
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Optional
 
-from maybe import Maybe
 from subtypes import DateTime, Dict
 from pathmagic import PathLike
 
@@ -10,18 +9,21 @@ from .serializer import Serializer
 
 
 class Cache:
-    """A cache class that abstracts away the process of persisting python objects to the filesystem using a dict-like interface (common dict methods and item access)."""
+    """
+    A cache class that abstracts away the process of persisting python objects to the filesystem using a dict-like interface (common dict methods and item access).
+    Each mutation is written to disk immediately, unless it is made within a 'with' block on the cache, in which case all mutations are written once upon exiting the outermost block.
+    """
 
     def __init__(self, file: PathLike, expiry: DateTime = None) -> None:
         self.serializer = Serializer(file)
-        self.expiry = expiry
-        self.content = self._get_content()
+        self.expiry, self.data = self._get_content(expiry=expiry)
+        self._batch_depth = 0
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({', '.join([f'{attr}={repr(val)}' for attr, val in self.__dict__.items() if not attr.startswith('_')])})"
 
     def __bool__(self) -> bool:
-        return self.serializer and DateTime.now() < self.expiry
+        return bool(self.serializer) and (self.expiry is None or DateTime.now() < self.expiry)
 
     def __getitem__(self, key: str) -> Any:
         return self.get(key)
@@ -33,35 +35,41 @@ class Cache:
         self.pop(key)
 
     def __contains__(self, name: str) -> bool:
-        return name in self.content.data
+        return name in self.data
 
     def __enter__(self) -> Cache:
+        self._batch_depth += 1
         return self
 
     def __exit__(self, ex_type: Any, ex_value: Any, ex_traceback: Any) -> None:
-        if ex_type is None:
-            self.serializer.serialize(self.content)
+        self._batch_depth -= 1
+        if ex_type is None and not self._batch_depth:
+            self.flush()
 
     def get(self, key: str, fallback: Any = None) -> Any:
         """Get a given item from the cache by its key. Returns the fallback (default None) if the key cannot be found."""
-        return self.content.data.get(key, fallback)
+        return self.data.get(key, fallback)
 
     def put(self, key: str, val: Any) -> None:
         """Put an item into the cache with the given key."""
         with self:
-            self.content.data[key] = val
+            self.data[key] = val
 
     def pop(self, key: str, fallback: Any = None) -> Any:
         """Return an item from the cache by its key and simultaneously remove it from the cache. Returns the fallback (default None) if the key cannot be found."""
         with self:
-            return self.content.data.pop(key, fallback)
+            return self.data.pop(key, fallback)
 
     def setdefault(self, key: str, default: Any) -> Any:
         """Return an item from the cache by its key. If the key cannot be found, the default value will be added to the cache under that key, and then returned."""
         with self:
-            return self.content.data.setdefault(key, default)
+            return self.data.setdefault(key, default)
 
-    def _get_content(self) -> Any:
+    def flush(self) -> None:
+        """Write the current contents of the cache to disk."""
+        self.serializer.serialize((self.expiry, self.data))
+
+    def _get_content(self, expiry: Optional[DateTime]) -> tuple[Optional[DateTime], Dict]:
         # try:
         #     content = self.serializer.deserialize()
         # except Exception as ex:
@@ -69,13 +77,18 @@ class Cache:
         #     content = None
 
         content = self.serializer.deserialize()
-        if not content:
-            content = self.Content(expires_on=self.expiry)
+        if isinstance(content, Cache.Content):
+            content = content.expiry, content.data
+
+        if not content or (content[0] is not None and DateTime.now() >= content[0]):
+            content = expiry, Dict()
             self.serializer.serialize(content)
 
         return content
 
     class Content:
+        """The format in which caches were persisted by earlier versions. Only retained so that their files can still be read."""
+
         def __init__(self, expires_on: DateTime) -> None:
             self.expiry = expires_on
             self.data = Dict()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Optional
 
 from subtypes import Dict
 from pathmagic import PathLike, File, Dir
@@ -36,7 +36,8 @@ class Config:
             self.root, self.dir = parent.root, parent.dir.new_dir(self.name)
 
         self.file = self.dir.new_file("config", extension="json")
-        self.data: Dict = self.file.content or Dict(self.default or {})
+        self.data: Dict = (content := self.file.content) or Dict(self.default or {})
+        self._persisted: Optional[str] = repr(self.data) if content else None
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({', '.join([f'{attr}={repr(val)}' for attr, val in self.__dict__.items() if not attr.startswith('_')])})"
@@ -74,5 +75,7 @@ class Config:
         return self.file.start()
 
     def save(self) -> None:
-        """Persist the changes to the 'Config.data' attribute to the config file."""
-        self.file.content = self.data
+        """Persist the changes to the 'Config.data' attribute to the config file. The file is left untouched if the data has not changed since it was last read or written."""
+        if (current := repr(self.data)) != self._persisted:
+            self.file.content = self.data
+            self._persisted = current
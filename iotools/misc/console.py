@@ -1,17 +1,14 @@
 from __future__ import annotations
 
+import os
 import sys
 import contextlib
+import functools
+import io
 import types
-from typing import Any, Sequence, Set, Callable, cast, TypeVar
+from typing import Any, Iterator, Optional, Sequence, Set, Callable, cast, TypeVar
 import ctypes
 
-import colorama
-import readchar
-import cursor
-import tabulate
-
-from maybe import Maybe
 from miscutils import is_running_in_ipython
 
 from iotools import res
@@ -19,6 +16,15 @@ from iotools import res
 res = cast(types.ModuleType, res)
 FuncSig = TypeVar("FuncSig", bound=Callable)
 
+if sys.platform == "win32":
+    import ctypes.wintypes
+
+    _show_window = ctypes.WinDLL("user32").ShowWindow
+    _show_window.argtypes, _show_window.restype = (ctypes.wintypes.HWND, ctypes.c_int), ctypes.wintypes.BOOL
+
+    _get_console_window = ctypes.WinDLL("kernel32").GetConsoleWindow
+    _get_console_window.argtypes, _get_console_window.restype = (), ctypes.wintypes.HWND
+
 
 class Console:
     """Provides console utilities such as the ability to show/hide the console, clearing lines, printing statements with hyphen separators, and offering choices with an interactive interface."""
@@ -28,7 +34,7 @@ class Console:
     UP_ONE_LINE = "\033[A"
     CLEAR_CURRENT_LINE = "\033[2K"
 
-    colorama.init()
+    _colorama_initialized = False
 
     class NoOutput:
         pass
@@ -36,17 +42,18 @@ class Console:
     @staticmethod
     def hide_console() -> None:
         """Hide the current application console. Only works on Windows systems."""
-        ctypes.WinDLL("user32").ShowWindow(ctypes.WinDLL("kernel32").GetConsoleWindow(), 0)
+        _show_window(_get_console_window(), 0)
 
     @staticmethod
     def show_console() -> None:
         """Show the current application console if it is hidden. Only works on Windows systems."""
-        ctypes.WinDLL("user32").ShowWindow(ctypes.WinDLL("kernel32").GetConsoleWindow(), 1)
+        _show_window(_get_console_window(), 1)
 
     @classmethod
     def clear_lines(cls, num: int = 1) -> None:
         """Clear the given number of lines previously displayed on the console."""
-        print(f"{cls.UP_ONE_LINE}{cls.CLEAR_CURRENT_LINE}"*num, end="")
+        cls._init_colorama()
+        cls._emit(cls._clear_sequence(num))
 
     @staticmethod
     def offer_choices(choices: Sequence, starting_choice: Any = None, multi_select: bool = False, desc: str = None, helptext: bool = True, display_repr: bool = True) -> Any:
@@ -58,16 +65,17 @@ class Console:
             if is_running_in_ipython():
                 return Console.prompt_choices(choices, desc=desc)
 
+            import cursor
+
+            Console._init_colorama()
+
             choices = list(choices)
             selected_index = 0 if starting_choice is None else choices.index(starting_choice)
 
             func = Console._collect_choices if multi_select else Console._collect_choice
 
-            with cursor.HiddenCursor():
-                result = func(choices=choices, starting_index=selected_index, desc=desc, helptext=helptext, display_repr=display_repr)
-
-            print("")
-            return result
+            with cursor.HiddenCursor(), Console._keyreader() as readkey:
+                return func(choices=choices, starting_index=selected_index, desc=desc, helptext=helptext, display_repr=display_repr, readkey=readkey)
         except KeyboardInterrupt:
             print("\n\nExiting...")
             sys.exit()
@@ -76,120 +84,206 @@ class Console:
     def offer_yes_or_no(default: bool, yes_text: str = 'YES', no_text: str = 'NO', desc: str = None) -> bool:
         """Interactively offer the user a binary choice. The choices can be customized and a description of the choice can be optionally provided."""
         mappings = {yes_text: True, no_text: False}
-        question = Maybe(desc).else_(f"[{yes_text}/{no_text}]")
+        question = f"[{yes_text}/{no_text}]" if desc is None else desc
         return mappings[Console.offer_choices(mappings, starting_choice=yes_text if default else no_text, desc=question, display_repr=False, helptext=False)]
 
     @staticmethod
     def prompt_choices(choices: Sequence, desc: str = None, fancy: bool = True) -> Any:
-        """Prompt the user to type in a choice. A description of the choice can be optionally provided."""
+        """
+        Prompt the user to type in a choice. A description of the choice can be optionally provided.
+        The choice is made as soon as the typed number cannot be extended into another valid option, or when enter is pressed.
+        If 'fancy' is False, the options are listed as plain numbered lines rather than as a grid table.
+        """
+        import readchar
+
         if desc is not None:
             print(f"\n{desc}\n\n")
 
-        print(tabulate.tabulate([(index + 1, key) for index, key in enumerate(choices)], headers=["number", "option"], tablefmt='fancy_grid'), end="\n\n")
+        choices = list(choices)
+        if fancy:
+            import tabulate
+
+            print(tabulate.tabulate([(index + 1, key) for index, key in enumerate(choices)], headers=["number", "option"], tablefmt='fancy_grid'), end="\n\n")
+        else:
+            width = len(str(len(choices)))
+            print("\n".join([f"{index + 1:>{width}} | {key}" for index, key in enumerate(choices)]), end="\n\n")
         print(f"Choose an option: 1-{len(choices)}. 'esc' to exit.\n")
 
-        choice, num_choices = None, len(choices)
-        escape_keys = [readchar.key.ESC, readchar.key.CTRL_C, "q", "Q"]
+        typed, num_choices = "", len(choices)
+        escape_keys = frozenset({readchar.key.ESC, readchar.key.CTRL_C, "q", "Q"})
 
         while True:
             if (keypress := readchar.readkey()) in escape_keys:
                 raise KeyboardInterrupt()
 
-            if 1 <= (choice := keypress) <= num_choices:
-                break
+            if keypress.isdigit():
+                typed += keypress
+                if int(typed)*10 <= num_choices:
+                    continue
+            elif keypress != readchar.key.ENTER:
+                continue
 
-        return choices[choice - 1]
+            if typed and 1 <= (choice := int(typed)) <= num_choices:
+                return choices[choice - 1]
+
+            typed = ""
 
     @staticmethod
     @contextlib.contextmanager
     def surround_sep(character: str = "-", start_sep: bool = True, stop_sep: bool = False, start_lines: int = 1, stop_lines: int = 1, start_length: int = 150, stop_length: int = 150,
                      prefix: str = "\n", suffix: str = "\n", start_padding: str = "\n\n", stop_padding: str = "\n") -> None:
         """Context manager that will print separators of the given lines and length on enter and/or exit (based on provided arguments)."""
-        br = "\n"
-
-        print(prefix, end="")
-        if start_sep:
-            print(f"{((character*start_length + br)*start_lines).strip()}{start_padding}", end="")
+        print(f"{prefix}{Console._separator(character, start_length, start_lines)}{start_padding}" if start_sep else prefix, end="")
 
         yield
 
-        if stop_sep:
-            print(f"{stop_padding}{((character*stop_length + br)*stop_lines).strip()}", end="")
-        print(suffix, end="")
+        print(f"{stop_padding}{Console._separator(character, stop_length, stop_lines)}{suffix}" if stop_sep else suffix, end="")
 
     @staticmethod
     def print_sep(text: str = None, character: str = "-", start_sep: bool = True, stop_sep: bool = True, start_lines: int = 1, stop_lines: int = 1,
                   start_length: int = 150, stop_length: int = 150, prefix: str = "\n", suffix: str = "\n", start_padding: str = "\n\n", stop_padding: str = "\n", **kwargs: Any) -> None:
         """Print the given string with separators of the given lines and length before and/or after (based on provided arguments)."""
-        with Console.surround_sep(character=character, start_sep=start_sep, stop_sep=stop_sep, start_lines=start_lines, stop_lines=stop_lines, start_length=start_length, stop_length=stop_length, prefix=prefix, suffix=suffix, start_padding=start_padding, stop_padding=stop_padding):
-            if text is not None:
-                print(text, **kwargs)
+        start = f"{prefix}{Console._separator(character, start_length, start_lines)}{start_padding}" if start_sep else prefix
+        stop = f"{stop_padding}{Console._separator(character, stop_length, stop_lines)}{suffix}" if stop_sep else suffix
+
+        body = io.StringIO()
+        if text is not None:
+            print(text, **{**kwargs, "file": body})
+
+        Console._emit(f"{start}{body.getvalue()}{stop}")
+
+    @classmethod
+    def _init_colorama(cls) -> None:
+        if not cls._colorama_initialized:
+            import colorama
+
+            colorama.init()
+            cls._colorama_initialized = True
 
     @staticmethod
-    def _collect_choice(choices: list, starting_index: int, desc: str, helptext: bool, display_repr: bool) -> Any:
-        if helptext:
-            print("Up/Down to navigate. Enter to choose and continue. Esc to exit.", end="\n\n")
+    @functools.lru_cache(maxsize=64)
+    def _separator(character: str, length: int, lines: int) -> str:
+        return ((character*length + "\n")*lines).strip()
 
-        if desc is not None:
-            print(desc, end="\n\n")
-
-        output, current_index = Console.NoOutput, starting_index
-        while output is Console.NoOutput:
-            print("\n".join([f"{'[x]' if index == current_index else '[ ]'} {repr(choice) if display_repr else choice}" for index, choice in enumerate(choices)]))
-
-            while True:
-                keypress = readchar.readkey()
-                if keypress == readchar.key.UP:
-                    current_index = max(current_index - 1, 0)
-                    break
-                elif keypress == readchar.key.DOWN:
-                    current_index = min(current_index + 1, len(choices) - 1)
-                    break
-                elif keypress == readchar.key.ENTER:
-                    output = choices[current_index]
-                    break
-                elif keypress == readchar.key.ESC:
-                    raise KeyboardInterrupt()
-
-            if output is Console.NoOutput:
-                Console.clear_lines(len(choices))
-
-        return output
+    @staticmethod
+    def _emit(text: str) -> None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
 
     @staticmethod
-    def _collect_choices(choices: list, starting_index: int, desc: str, helptext: bool, display_repr: bool) -> Any:
-        if helptext:
-            print("Up/Down to navigate. Right to add a choice. Left to remove a choice. Enter to continue. Esc to exit.", end="\n\n")
+    def _clear_sequence(num: int) -> str:
+        return f"\r\033[{num}A\033[0J" if num > 0 else ""
 
-        if desc is not None:
-            print(desc, end="\n\n")
+    @classmethod
+    def _redraw_lines(cls, rendered: list[str], lines: dict[int, str]) -> None:
+        """
+        Rewrite those of the given lines (keyed by their index) that differ from the 'rendered' block of lines printed immediately above the cursor, then return the cursor to where it was.
+        'rendered' is updated in place to reflect what is now on screen.
+        """
+        num_lines, output = len(rendered), []
+        for index, line in lines.items():
+            if line != rendered[index]:
+                rendered[index] = line
+                output.append(f"\r\033[{num_lines - index}A{cls.CLEAR_CURRENT_LINE}{line}\r\033[{num_lines - index}B")
+
+        if output:
+            cls._init_colorama()
+            cls._emit("".join(output))
+
+    @staticmethod
+    def _menu_header(helptext: Optional[str], desc: Optional[str]) -> str:
+        return "".join([f"{text}\n\n" for text in (helptext, desc) if text is not None])
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _keyreader() -> Iterator[Callable[[], str]]:
+        """
+        Yield a function that blocks until a single keypress is available and returns it, using the same key codes as readchar.
+        On POSIX terminals, the terminal is switched into cbreak mode once for the whole block rather than once per keypress.
+        """
+        import readchar
+
+        if sys.platform == "win32" or not sys.stdin.isatty():
+            yield readchar.readkey
+            return
+
+        import termios
+        import tty
+
+        fd = sys.stdin.fileno()
+        keys = {"\r": readchar.key.ENTER, "\n": readchar.key.ENTER, "\x1bOA": readchar.key.UP, "\x1bOB": readchar.key.DOWN, "\x1bOC": readchar.key.RIGHT, "\x1bOD": readchar.key.LEFT}
+
+        def readkey() -> str:
+            return keys.get(key := os.read(fd, 8).decode(errors="ignore"), key)
+
+        settings = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            yield readkey
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, settings)
+
+    @staticmethod
+    def _collect_choice(choices: list, starting_index: int, desc: str, helptext: bool, display_repr: bool, readkey: Callable[[], str] = None) -> Any:
+        import readchar
+
+        moves, enter, esc = {readchar.key.UP: -1, readchar.key.DOWN: 1}, readchar.key.ENTER, readchar.key.ESC
+        readkey = readkey or readchar.readkey
+        header = Console._menu_header(helptext="Up/Down to navigate. Enter to choose and continue. Esc to exit." if helptext else None, desc=desc)
+
+        labels = [repr(choice) if display_repr else str(choice) for choice in choices]
 
-        current_index, finished = starting_index, False
+        def render(index: int) -> str:
+            return f"{'[x]' if index == current_index else '[ ]'} {labels[index]}"
+
+        current_index = starting_index
+        rendered = [render(index) for index in range(len(choices))]
+        Console._emit(header + "\n".join(rendered) + "\n")
+
+        while True:
+            keypress = readkey()
+            if (step := moves.get(keypress)) is not None:
+                previous_index, current_index = current_index, min(max(current_index + step, 0), len(choices) - 1)
+                Console._redraw_lines(rendered, {index: render(index) for index in (previous_index, current_index)})
+            elif keypress == enter:
+                Console._emit("\n")
+                return choices[current_index]
+            elif keypress == esc:
+                raise KeyboardInterrupt()
+
+    @staticmethod
+    def _collect_choices(choices: list, starting_index: int, desc: str, helptext: bool, display_repr: bool, readkey: Callable[[], str] = None) -> Any:
+        import readchar
+
+        moves, enter, esc = {readchar.key.UP: -1, readchar.key.DOWN: 1}, readchar.key.ENTER, readchar.key.ESC
+        readkey = readkey or readchar.readkey
+        header = Console._menu_header(helptext="Up/Down to navigate. Right to add a choice. Left to remove a choice. Enter to continue. Esc to exit." if helptext else None, desc=desc)
+
+        labels = [repr(choice) if display_repr else str(choice) for choice in choices]
+
+        def render(index: int) -> str:
+            return f"{'>' if index == current_index else ' '} {'[x]' if index in selected_indices else '[ ]'} {labels[index]}"
+
+        current_index = starting_index
         selected_indices: Set[int] = set()
-        while not finished:
-            print("\n".join([f"{'>' if index == current_index else ' '} {'[x]' if index in selected_indices else '[ ]'} {repr(choice) if display_repr else choice}" for index, choice in enumerate(choices)]))
-
-            while True:
-                keypress = readchar.readkey()
-                if keypress == readchar.key.UP:
-                    current_index = max(current_index - 1, 0)
-                    break
-                elif keypress == readchar.key.DOWN:
-                    current_index = min(current_index + 1, len(choices) - 1)
-                    break
-                if keypress == readchar.key.RIGHT:
-                    selected_indices.add(current_index)
-                    break
-                elif keypress == readchar.key.LEFT:
-                    selected_indices.discard(current_index)
-                    break
-                elif keypress == readchar.key.ENTER:
-                    finished = True
-                    break
-                elif keypress == readchar.key.ESC:
-                    raise KeyboardInterrupt()
-
-            if not finished:
-                Console.clear_lines(len(choices))
-
-        return [choices[index] for index in selected_indices]
+        toggles = {readchar.key.RIGHT: selected_indices.add, readchar.key.LEFT: selected_indices.discard}
+        rendered = [render(index) for index in range(len(choices))]
+        Console._emit(header + "\n".join(rendered) + "\n")
+
+        while True:
+            keypress = readkey()
+            if (step := moves.get(keypress)) is not None:
+                previous_index, current_index = current_index, min(max(current_index + step, 0), len(choices) - 1)
+                changed = (previous_index, current_index)
+            elif (toggle := toggles.get(keypress)) is not None:
+                toggle(current_index)
+                changed = (current_index,)
+            elif keypress == enter:
+                Console._emit("\n")
+                return [choices[index] for index in selected_indices]
+            elif keypress == esc:
+                raise KeyboardInterrupt()
+            else:
+                continue
+
+            Console._redraw_lines(rendered, {index: render(index) for index in changed})
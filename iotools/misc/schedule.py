@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
-from typing import Any, Callable, Optional, List
+from typing import Any, Callable, Optional, List, Set, Union
 
 from apscheduler.schedulers.background import BlockingScheduler
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
@@ -29,77 +30,145 @@ class Enums:
         WeekDay.SUNDAY: 6,
     }
 
+    month_mappings = {month: number for number, month in enumerate(Month, start=1)}
+
+
+class SlotsReprMixin:
+    """A ReprMixin for classes using __slots__, which have no instance __dict__ for the repr to be built from."""
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        attrs = [attr for cls in reversed(type(self).__mro__) for attr in vars(cls).get("__slots__", ())]
+        return f"{type(self).__name__}({', '.join([f'{attr}={repr(getattr(self, attr))}' for attr in attrs])})"
+
 
 class Schedule(ReprMixin):
     """
     A class used to specify schedules on which specific Python callables will be executed. Event callbacks can be supplied to be invoked on success
-    or failure. By default a blocking scheduler is used, which will enter a blocking main loop upon starting.
+    or failure. By default a blocking scheduler is used, which will enter a blocking main loop upon starting, unless an asyncio event loop is already running,
+    in which case the jobs are scheduled on that loop instead.
+    Jobs coalesce missed runs into one, never run concurrently with themselves, and are skipped if they could not start within a second of their
+    scheduled time. These can be adjusted through the 'coalesce', 'max_instances' and 'misfire_grace_time' attributes of the schedule's settings.
+    Passing 'shared=True' reuses the scheduler of any other shared Schedule with the same name, so that their jobs run on a single scheduler.
     """
 
     scheduler_constructor = BlockingScheduler
 
-    def __init__(self, name: str = "default", on_success: Callable = None, on_failure: Callable = None) -> None:
-        self.name = name
-        self.scheduler = self.scheduler_constructor()
+    # the month and day cron fields always come from the selected month and day parts, so only yearly and weekly intervals add a wildcard field
+    _interval_fields: dict[Enums.TimeUnit, dict[str, str]] = {
+        Enums.TimeUnit.YEARS: {"year": "*"},
+        Enums.TimeUnit.MONTHS: {},
+        Enums.TimeUnit.WEEKS: {"week": "*"},
+        Enums.TimeUnit.DAYS: {},
+    }
+    _relative_fields = ("seconds", "minutes", "hours", "days", "weeks", "months", "years")
+    _shared_schedulers: dict[str, BlockingScheduler] = {}
+    _shared_listeners: dict[str, set[tuple[Callable, int]]] = {}
 
-        if on_success is not None:
-            self.scheduler.add_listener(callback=on_success, mask=EVENT_JOB_EXECUTED)
+    def __init__(self, name: str = "default", on_success: Callable = None, on_failure: Callable = None, shared: bool = False) -> None:
+        self.name, self.shared = name, shared
+        self._registered: set[tuple] = set()
 
-        if on_failure is not None:
-            self.scheduler.add_listener(callback=on_failure, mask=EVENT_JOB_ERROR)
+        if not shared:
+            self.scheduler, listeners = self._resolve_scheduler_constructor()(), set()
+        else:
+            if (scheduler := self._shared_schedulers.get(name)) is None:
+                scheduler = self._shared_schedulers[name] = self._resolve_scheduler_constructor()()
+
+            self.scheduler, listeners = scheduler, self._shared_listeners.setdefault(name, set())
+
+        for callback, mask in ((on_success, EVENT_JOB_EXECUTED), (on_failure, EVENT_JOB_ERROR)):
+            if callback is not None and (callback, mask) not in listeners:
+                self.scheduler.add_listener(callback=callback, mask=mask)
+                listeners.add((callback, mask))
 
     def __enter__(self) -> Schedule:
         return self
 
     def __exit__(self, ex_type: Any, ex_value: Any, ex_traceback: Any) -> None:
-        self.scheduler.start()
+        if not self.scheduler.running:
+            self.scheduler.start()
 
     @property
     def every(self) -> Fixed.Selector.Start:
         return Fixed.Selector.Start(Fixed.Settings(schedule=self))
 
+    @classmethod
+    def _resolve_scheduler_constructor(cls) -> Callable:
+        if cls.scheduler_constructor is not BlockingScheduler:
+            return cls.scheduler_constructor
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return BlockingScheduler
+
+        from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+        return AsyncIOScheduler
+
+    def _is_registered(self, signature: tuple) -> bool:
+        """Return True if an identical job was already registered on this schedule, otherwise record it and return False. Jobs with unhashable arguments are never treated as duplicates."""
+        try:
+            if signature in self._registered:
+                return True
+
+            self._registered.add(signature)
+        except TypeError:
+            pass
+
+        return False
+
+    @staticmethod
+    def _job_signature(func: Callable, job_id: str, args: Optional[tuple], kwargs: Optional[dict], settings: Union[Fixed.Settings, Relative.Settings]) -> tuple:
+        return func, job_id, tuple(args or ()), tuple((kwargs or {}).items()), settings.coalesce, settings.max_instances, settings.misfire_grace_time
+
     def _register_relative_interval(self, settings: Relative.Settings, func: Callable, args: tuple = None, kwargs: dict = None, job_id: str = None):
-        ns = vars(settings)
-        self.scheduler.add_job(func, trigger="interval", args=args, kwargs=kwargs, id=job_id or func.__name__,
-                               start_date=settings.start_time, end_date=settings.end_time,
-                               seconds=settings.seconds, minutes=settings.minutes, hours=settings.hours,
-                               days=settings.days, weeks=settings.weeks, months=settings.months, years=settings.years)
+        job_id, intervals = job_id or func.__name__, {name: value for name in self._relative_fields if (value := getattr(settings, name))}
+        if self._is_registered((*self._job_signature(func, job_id, args, kwargs, settings), *intervals.items(), settings.start_time, settings.end_time)):
+            return
+
+        self.scheduler.add_job(func, trigger="interval", args=args, kwargs=kwargs, id=job_id,
+                               start_date=settings.start_time, end_date=settings.end_time, coalesce=settings.coalesce,
+                               max_instances=settings.max_instances, misfire_grace_time=settings.misfire_grace_time, **intervals)
 
     def _register_fixed_interval(self, settings: Fixed.Settings, func: Callable, args: tuple = None, kwargs: dict = None, job_id: str = None) -> None:
         if settings.weekday_parts and settings.day_parts:
             raise ValueError(f"Cannot simultaenously provide weekday and ordinal day arguments to a schedule. Use one or the other.")
 
-        year = month = day = week = None
-
-        if settings.interval is Enums.TimeUnit.YEARS:
-            year = "*"
-        elif settings.interval is Enums.TimeUnit.MONTHS:
-            month = "*"
-        elif settings.interval is Enums.TimeUnit.WEEKS:
-            week = "*"
-        elif settings.interval is Enums.TimeUnit.DAYS:
-            day = "*"
-        else:
+        if (interval_fields := self._interval_fields.get(settings.interval)) is None:
             raise ValueError(f"Invalid interval value: {settings.interval}.") if isinstance(settings.interval, Enums.TimeUnit) else TypeError(f"Invalid interval type: {type(settings.interval).__name__}.")
 
-        start_date, end_date = settings.start_date, settings.end_date
-        day_of_week = None if not settings.weekday_parts else ",".join([str(Enums.weekday_mappings[weekday]) for weekday in settings.weekday_parts])
-        month = None if not settings.month_parts else ",".join([month.name.lower() for month in settings.month_parts])
-        day = None if not settings.day_parts else ",".join([str(day) for day in settings.day_parts])
+        job_id = job_id or func.__name__
+        signature = (
+            *self._job_signature(func, job_id, args, kwargs, settings), settings.interval, frozenset(settings.month_parts), frozenset(settings.day_parts),
+            frozenset(settings.weekday_parts), tuple(settings.time_parts), settings.start_date, settings.end_date,
+        )
+        if self._is_registered(signature):
+            return
+
+        cron = dict(
+            trigger="cron", args=args, kwargs=kwargs, year=None, week=None,
+            month=",".join([month.name.lower() for month in sorted(settings.month_parts, key=Enums.month_mappings.get)]) or None,
+            day=",".join([str(day) for day in sorted(settings.day_parts)]) or None,
+            day_of_week=",".join([str(weekday) for weekday in sorted([Enums.weekday_mappings[weekday] for weekday in settings.weekday_parts])]) or None,
+            start_date=settings.start_date, end_date=settings.end_date,
+            coalesce=settings.coalesce, max_instances=settings.max_instances, misfire_grace_time=settings.misfire_grace_time,
+        )
+        cron.update(interval_fields)
 
         if not settings.time_parts:
-            self.scheduler.add_job(func, trigger="cron", args=args, kwargs=kwargs, id=job_id or func.__name__,
-                                   year=year, month=month, day=day, week=week, day_of_week=day_of_week,
-                                   hour=None, minute=None, second=None, start_date=start_date, end_date=end_date)
+            self.scheduler.add_job(func, **cron, id=job_id, hour=None, minute=None, second=None)
         else:
-            for time in settings.time_parts:
-                self.scheduler.add_job(func, trigger="cron", args=args, kwargs=kwargs, id=job_id or func.__name__,
-                                       year=year, month=month, day=day, week=week, day_of_week=day_of_week,
-                                       hour=time.hour, minute=time.minute, second=time.second, start_date=start_date, end_date=end_date)
+            for index, time in enumerate(dict.fromkeys(settings.time_parts)):
+                self.scheduler.add_job(func, **cron, id=f"{job_id}_{index}" if index else job_id, hour=time.hour, minute=time.minute, second=time.second)
 
 
 class Fixed:
-    class Settings(ReprMixin):
+    class Settings(SlotsReprMixin):
+        __slots__ = ("schedule", "interval", "start_date", "end_date", "month_parts", "day_parts", "weekday_parts", "time_parts",
+                     "coalesce", "max_instances", "misfire_grace_time")
+
         def __init__(self, schedule: Schedule) -> None:
             self.schedule = schedule
 
@@ -107,148 +176,91 @@ class Fixed:
             self.start_date: Optional[DateTime] = None
             self.end_date: Optional[DateTime] = None
 
-            self.month_parts: List[Enums.Month] = []
-            self.day_parts: List[int] = []
-            self.weekday_parts: List[Enums.WeekDay] = []
+            self.month_parts: Set[Enums.Month] = set()
+            self.day_parts: Set[int] = set()
+            self.weekday_parts: Set[Enums.WeekDay] = set()
             self.time_parts: List[dt.time] = []
 
+            self.coalesce, self.max_instances, self.misfire_grace_time = True, 1, 1
+
         def as_dict(self) -> dict:
             return {}
 
     class Selector:
-        class Base(ReprMixin):
+        class Base(SlotsReprMixin):
+            __slots__ = ("settings",)
+
             def __init__(self, settings: Fixed.Settings = None) -> None:
                 self.settings = settings
 
         class MonthMixin:
-            settings: Fixed.Settings
-
-            @property
-            def january(self) -> Fixed.Interval.ChainableMonth:
-                self._set_month(Enums.Month.JANUARY)
-                return Fixed.Interval.ChainableMonth(settings=self.settings)
-
-            @property
-            def february(self) -> Fixed.Interval.ChainableMonth:
-                self._set_month(Enums.Month.FEBRUARY)
-                return Fixed.Interval.ChainableMonth(settings=self.settings)
-
-            @property
-            def march(self) -> Fixed.Interval.ChainableMonth:
-                self._set_month(Enums.Month.MARCH)
-                return Fixed.Interval.ChainableMonth(settings=self.settings)
-
-            @property
-            def april(self) -> Fixed.Interval.ChainableMonth:
-                self._set_month(Enums.Month.APRIL)
-                return Fixed.Interval.ChainableMonth(settings=self.settings)
+            __slots__ = ()
 
-            @property
-            def may(self) -> Fixed.Interval.ChainableMonth:
-                self._set_month(Enums.Month.MAY)
-                return Fixed.Interval.ChainableMonth(settings=self.settings)
-
-            @property
-            def june(self) -> Fixed.Interval.ChainableMonth:
-                self._set_month(Enums.Month.JUNE)
-                return Fixed.Interval.ChainableMonth(settings=self.settings)
-
-            @property
-            def july(self) -> Fixed.Interval.ChainableMonth:
-                self._set_month(Enums.Month.JULY)
-                return Fixed.Interval.ChainableMonth(settings=self.settings)
+            settings: Fixed.Settings
 
-            @property
-            def august(self) -> Fixed.Interval.ChainableMonth:
-                self._set_month(Enums.Month.AUGUST)
-                return Fixed.Interval.ChainableMonth(settings=self.settings)
+            def _month_property(month: Enums.Month) -> property:
+                def getter(self: Fixed.Selector.MonthMixin) -> Fixed.Interval.ChainableMonth:
+                    self._set_month(month)
+                    return _ChainableMonth(settings=self.settings)
 
-            @property
-            def september(self) -> Fixed.Interval.ChainableMonth:
-                self._set_month(Enums.Month.SEPTEMBER)
-                return Fixed.Interval.ChainableMonth(settings=self.settings)
-
-            @property
-            def october(self) -> Fixed.Interval.ChainableMonth:
-                self._set_month(Enums.Month.OCTOBER)
-                return Fixed.Interval.ChainableMonth(settings=self.settings)
+                return property(getter)
 
-            @property
-            def november(self) -> Fixed.Interval.ChainableMonth:
-                self._set_month(Enums.Month.NOVEMBER)
-                return Fixed.Interval.ChainableMonth(settings=self.settings)
+            for _month in Enums.Month:
+                locals()[_month.name.lower()] = _month_property(_month)
 
-            @property
-            def december(self) -> Fixed.Interval.ChainableMonth:
-                self._set_month(Enums.Month.DECEMBER)
-                return Fixed.Interval.ChainableMonth(settings=self.settings)
+            del _month, _month_property
 
             def _set_month(self, month: Enums.Month) -> None:
-                self.settings.month_parts.append(month)
+                self.settings.month_parts.add(month)
                 if self.settings.interval is None:
                     self.settings.interval = Enums.TimeUnit.YEARS
 
         class Month(Base, MonthMixin):
-            pass
+            __slots__ = ()
 
         class WeekdayMixin:
+            __slots__ = ()
+
             settings: Fixed.Settings
 
-            @property
-            def monday(self) -> Fixed.Interval.ChainableWeekDay:
-                self._set_weekday(Enums.WeekDay.MONDAY)
-                return Fixed.Interval.ChainableWeekDay(settings=self.settings)
+            def _weekday_property(weekday: Enums.WeekDay) -> property:
+                def getter(self: Fixed.Selector.WeekdayMixin) -> Fixed.Interval.ChainableWeekDay:
+                    self._set_weekday(weekday)
+                    return _ChainableWeekDay(settings=self.settings)
 
-            @property
-            def tuesday(self) -> Fixed.Interval.ChainableWeekDay:
-                self._set_weekday(Enums.WeekDay.TUESDAY)
-                return Fixed.Interval.ChainableWeekDay(settings=self.settings)
+                return property(getter)
 
-            @property
-            def wednesday(self) -> Fixed.Interval.ChainableWeekDay:
-                self._set_weekday(Enums.WeekDay.WEDNESDAY)
-                return Fixed.Interval.ChainableWeekDay(settings=self.settings)
+            for _weekday in Enums.WeekDay:
+                locals()[_weekday.name.lower()] = _weekday_property(_weekday)
 
-            @property
-            def thursday(self) -> Fixed.Interval.ChainableWeekDay:
-                self._set_weekday(Enums.WeekDay.THURSDAY)
-                return Fixed.Interval.ChainableWeekDay(settings=self.settings)
-
-            @property
-            def friday(self) -> Fixed.Interval.ChainableWeekDay:
-                self._set_weekday(Enums.WeekDay.FRIDAY)
-                return Fixed.Interval.ChainableWeekDay(settings=self.settings)
-
-            @property
-            def saturday(self) -> Fixed.Interval.ChainableWeekDay:
-                self._set_weekday(Enums.WeekDay.SATURDAY)
-                return Fixed.Interval.ChainableWeekDay(settings=self.settings)
-
-            @property
-            def sunday(self) -> Fixed.Interval.ChainableWeekDay:
-                self._set_weekday(Enums.WeekDay.SUNDAY)
-                return Fixed.Interval.ChainableWeekDay(settings=self.settings)
+            del _weekday, _weekday_property
 
             def _set_weekday(self, weekday: Enums.WeekDay) -> None:
-                self.settings.weekday_parts.append(weekday)
+                self.settings.weekday_parts.add(weekday)
                 if self.settings.interval is None:
                     self.settings.interval = Enums.TimeUnit.WEEKS
 
         class Weekday(Base, WeekdayMixin):
-            pass
+            __slots__ = ()
 
         class Day(Base):
+            __slots__ = ()
+
             def __call__(self, day: int) -> Fixed.Interval.ChainableDay:
-                self.settings.day_parts.append(day)
-                return Fixed.Interval.ChainableDay(settings=self.settings)
+                self.settings.day_parts.add(day)
+                return _ChainableDay(settings=self.settings)
 
         class Time(Base):
+            __slots__ = ()
+
             def __call__(self, *time_args) -> Fixed.Interval.ChainableDay:
                 time = time_args[0] if len(time_args) == 1 and isinstance(time_args[0], dt.time) else dt.time(*time_args)
                 self.settings.time_parts.append(time)
-                return Fixed.Interval.ChainableDay(settings=self.settings)
+                return _ChainableDay(settings=self.settings)
 
         class Start(Base, MonthMixin, WeekdayMixin):
+            __slots__ = ()
+
             def __call__(self, magnitude: int) -> Relative.Selector.Year:
                 return Relative.Selector.Year(magnitude=magnitude, settings=Relative.Settings(schedule=self.settings.schedule))
 
@@ -263,25 +275,27 @@ class Fixed:
             @property
             def day(self) -> Fixed.Interval.Day:
                 self.settings.interval = Enums.TimeUnit.DAYS
-                return Fixed.Interval.Day(settings=self.settings)
+                return _Day(settings=self.settings)
 
             @property
             def week(self) -> Fixed.Interval.Month:
                 self.settings.interval = Enums.TimeUnit.WEEKS
-                return Fixed.Interval.Month(settings=self.settings)
+                return _Month(settings=self.settings)
 
             @property
             def month(self) -> Fixed.Interval.Month:
                 self.settings.interval = Enums.TimeUnit.MONTHS
-                return Fixed.Interval.Month(settings=self.settings)
+                return _Month(settings=self.settings)
 
             @property
             def year(self) -> Fixed.Interval.Year:
                 self.settings.interval = Enums.TimeUnit.YEARS
-                return Fixed.Interval.Year(settings=self.settings)
+                return _Year(settings=self.settings)
 
     class Interval:
-        class Final(ReprMixin):
+        class Final(SlotsReprMixin):
+            __slots__ = ("settings",)
+
             def __init__(self, settings: Fixed.Settings = None) -> None:
                 self.settings = settings
 
@@ -298,26 +312,36 @@ class Fixed:
                 return Fixed.Interval.Final(settings=self.settings)
 
         class ChainableFinal(Final):
+            __slots__ = ()
+
             @property
             def and_(self) -> Fixed.Interval.ChainableFinal:
                 return Fixed.Interval.ChainableFinal(settings=self.settings)
 
         class Day(Final):
+            __slots__ = ()
+
             @property
             def at(self) -> Fixed.Selector.Time:
                 return Fixed.Selector.Time(settings=self.settings)
 
         class ChainableDay(Final):
+            __slots__ = ()
+
             @property
             def and_(self) -> Fixed.Selector.Time:
                 return Fixed.Selector.Time(settings=self.settings)
 
         class ChainableWeekDay(Day):
+            __slots__ = ()
+
             @property
             def and_(self) -> Fixed.Selector.Weekday:
                 return Fixed.Selector.Weekday(settings=self.settings)
 
         class Month(Final):
+            __slots__ = ()
+
             @property
             def on_the(self) -> Fixed.Selector.Day:
                 return Fixed.Selector.Day(settings=self.settings)
@@ -327,65 +351,89 @@ class Fixed:
                 return Fixed.Selector.Weekday(settings=self.settings)
 
         class ChainableMonth(Month):
+            __slots__ = ()
+
             @property
             def and_(self) -> Fixed.Selector.Month:
                 return Fixed.Selector.Month(settings=self.settings)
 
         class Year(Final):
+            __slots__ = ()
+
             @property
             def in_(self) -> Fixed.Selector.Month:
                 return Fixed.Selector.Month(settings=self.settings)
 
 
 class Relative:
-    class Settings(ReprMixin):
+    class Settings(SlotsReprMixin):
+        __slots__ = ("schedule", "start_time", "end_time", "years", "months", "weeks", "days", "hours", "minutes", "seconds",
+                     "coalesce", "max_instances", "misfire_grace_time")
+
         def __init__(self, schedule: Schedule, start_time: DateTime = None, end_time: DateTime = None) -> None:
             self.schedule, self.start_time, self.end_time = schedule, start_time, end_time
             self.years = self.months = self.weeks = self.days = self.hours = self.minutes = self.seconds = 0
+            self.coalesce, self.max_instances, self.misfire_grace_time = True, 1, 1
 
     class Selector:
-        class Base(ReprMixin):
+        class Base(SlotsReprMixin):
+            __slots__ = ("magnitude", "settings")
+
             def __init__(self, magnitude: int, settings: Relative.Settings) -> None:
                 self.magnitude, self.settings = magnitude, settings
 
         class Second(Base):
+            __slots__ = ()
+
             @property
             def seconds(self) -> Relative.Interval.Final:
                 self.settings.seconds = self.magnitude
                 return Relative.Interval.Final(settings=self.settings)
 
         class Minute(Second):
+            __slots__ = ()
+
             @property
             def minutes(self) -> Relative.Interval.Minute:
                 self.settings.minutes = self.magnitude
                 return Relative.Interval.Minute(settings=self.settings)
 
         class Hour(Minute):
+            __slots__ = ()
+
             @property
             def hours(self) -> Relative.Interval.Hour:
                 self.settings.hours = self.magnitude
                 return Relative.Interval.Hour(settings=self.settings)
 
         class Day(Hour):
+            __slots__ = ()
+
             @property
             def days(self) -> Relative.Interval.Day:
                 self.settings.days = self.magnitude
                 return Relative.Interval.Day(settings=self.settings)
 
         class Month(Day):
+            __slots__ = ()
+
             @property
             def months(self) -> Relative.Interval.Month:
                 self.settings.months = self.magnitude
                 return Relative.Interval.Month(settings=self.settings)
 
         class Year(Month):
+            __slots__ = ()
+
             @property
             def years(self) -> Relative.Interval.Year:
                 self.settings.years = self.magnitude
                 return Relative.Interval.Year(settings=self.settings)
 
     class Interval:
-        class Final(ReprMixin):
+        class Final(SlotsReprMixin):
+            __slots__ = ("settings",)
+
             def __init__(self, settings: Relative.Settings) -> None:
                 self.settings = settings
 
@@ -402,21 +450,36 @@ class Relative:
                 return Relative.Interval.Final(settings=self.settings)
 
         class Minute(Final):
+            __slots__ = ()
+
             def and_(self, magnitude: int) -> Relative.Selector.Second:
                 return Relative.Selector.Second(magnitude=magnitude, settings=self.settings)
 
         class Hour(Final):
+            __slots__ = ()
+
             def and_(self, magnitude: int) -> Relative.Selector.Minute:
                 return Relative.Selector.Minute(magnitude=magnitude, settings=self.settings)
 
         class Day(Final):
+            __slots__ = ()
+
             def and_(self, magnitude: int) -> Relative.Selector.Hour:
                 return Relative.Selector.Hour(magnitude=magnitude, settings=self.settings)
 
         class Month(Final):
+            __slots__ = ()
+
             def and_(self, magnitude: int) -> Relative.Selector.Day:
                 return Relative.Selector.Day(magnitude=magnitude, settings=self.settings)
 
         class Year(Final):
+            __slots__ = ()
+
             def and_(self, magnitude: int) -> Relative.Selector.Month:
                 return Relative.Selector.Month(magnitude=magnitude, settings=self.settings)
+
+
+# Module-level aliases for the interval classes returned by the selector properties, saving the nested attribute lookups on each step of the DSL
+_ChainableMonth, _ChainableWeekDay, _ChainableDay = Fixed.Interval.ChainableMonth, Fixed.Interval.ChainableWeekDay, Fixed.Interval.ChainableDay
+_Day, _Month, _Year = Fixed.Interval.Day, Fixed.Interval.Month, Fixed.Interval.Year
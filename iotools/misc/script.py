@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 import pathlib
-from types import MethodType
-from typing import Any, Callable, Type
-import inspect
-
-from wrapt import decorator
+import functools
+import reprlib
+from types import FunctionType
+from typing import Any, Callable, Type, Union
 
 from subtypes import DateTime, Enum
 from pathmagic import Dir
@@ -23,74 +22,111 @@ class Enums:
 class ScriptMeta(type):
     """The metaclass driving the Script class' magic behaviour."""
 
+    _argument_repr = reprlib.Repr()
+    _argument_repr.maxstring = _argument_repr.maxother = 200
+
     def __init__(cls: Type[Script], name: str, bases: Any, namespace: dict) -> None:
         if bases:
             cls._recursively_wrap(item=cls)
             cls.__init__ = cls._init_wrapper()(cls.__init__)
 
     def _recursively_wrap(cls: Type[Script], item: Any) -> None:
-        for name, val in vars(item).items():
+        for name, val in list(vars(item).items()):
             if cls._is_valid_function_type(val) and (name == "__init__" or not (name.startswith("__") and name.endswith("__"))):
                 setattr(item, name, cls._script_wrapper()(val))
 
-            elif inspect.isclass(val):
+            elif isinstance(val, type):
                 cls._recursively_wrap(item=val)
 
     def _init_wrapper(cls: Type[Script]) -> Callable:
-        @decorator
-        def init_wrapper(func: Callable, script: Any, args: Any, kwargs: Any) -> None:
-            if pathlib.Path(cls.log_location).is_absolute():
-                logs_dir = Dir(cls.log_location)
-            else:
-                logs_dir = Dir.from_appdata(systemwide=not executed_within_user_tree()).new_dir("python").new_dir("logs").join_dir(cls.log_location)
-
-            now = DateTime.now()
-            log_path = logs_dir.new_dir(now.date().to_isoformat()).new_dir(cls.__name__).new_file(f"[{now.hour:02d}h {now.minute:02d}m {now.second:02d}s]", "log")
-            cls.log = log = IndentationPrintLog(log_path)
-
-            with log:
-                try:
-                    func(*args, **kwargs)
-                except Exception as ex:
-                    exception = ex
-                else:
-                    exception = None
+        def wrap(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def init_wrapper(script: Any, *args: Any, **kwargs: Any) -> None:
+                now = DateTime.now()
+                log_path = cls._logs_dir(cls.log_location).new_dir(now.date().to_isoformat()).new_dir(cls.__name__).new_file(f"[{now.hour:02d}h {now.minute:02d}m {now.second:02d}s]", "log")
+                cls.log = log = IndentationPrintLog(log_path)
+
+                with log:
+                    try:
+                        func(script, *args, **kwargs)
+                    except Exception as ex:
+                        exception = ex
+                    else:
+                        exception = None
+
+                    with log.no_indentation():
+                        log.delimiter_lesser()
+                        log.debug(f"At point of exit, the final state of the script object was:")
+                        log.debug(str(script))
 
-                with log.no_indentation():
-                    log.delimiter_lesser()
-                    log.debug(f"At point of exit, the final state of the script object was:")
-                    log.debug(str(script))
+                if cls.logging_level is Enums.LoggingLevel.ALWAYS_SERIALIZE or exception is not None and cls.logging_level is Enums.LoggingLevel.SERIALIZE_ON_FAILURE:
+                    log.file.new_rename(cls.log.file.stem, "pkl").write(script)
 
-            if cls.logging_level is Enums.LoggingLevel.ALWAYS_SERIALIZE or exception is not None and cls.logging_level is Enums.LoggingLevel.SERIALIZE_ON_FAILURE:
-                log.file.new_rename(cls.log.file.stem, "pkl").write(script)
+                if exception is not None:
+                    raise exception
 
-            if exception is not None:
-                raise exception
+            return init_wrapper
 
-        return init_wrapper
+        return wrap
 
     def _script_wrapper(cls: Type[Script]) -> Callable:
-        @decorator
-        def script_wrapper(func: MethodType, instance: Any, args: Any, kwargs: Any) -> Any:
-            positional = ', '.join(([] if instance is None else ["self"]) + [repr(arg) for arg in args])
-            keyword = ', '.join([f'{name}={repr(val)}' for name, val in kwargs.items()])
-            arguments = f"{positional}{f', ' if positional and keyword else ''}{keyword}"
+        argument_repr, debug_level = cls._argument_repr.repr, IndentationPrintLog.LogLevel.DEBUG
+
+        def wrap(func: Union[FunctionType, staticmethod, classmethod]) -> Callable:
+            if isinstance(func, (staticmethod, classmethod)):
+                return type(func)(wrap_function(func.__func__, bound=isinstance(func, classmethod), on_class=True))
+
+            return wrap_function(func, bound=True, on_class=False)
+
+        def wrap_function(func: FunctionType, bound: bool, on_class: bool) -> Callable:
+            @functools.wraps(func)
+            def script_wrapper(*args: Any, **kwargs: Any) -> Any:
+                log = cls.log
+                if log.level > debug_level:
+                    log.indentation_level += 1
+                    try:
+                        return func(*args, **kwargs)
+                    finally:
+                        log.indentation_level -= 1
+
+                if bound:
+                    owner, *call_args = args
+                    func_name = f"{owner.__name__ if on_class else type(owner).__name__}.{func.__name__}"
+                else:
+                    call_args, func_name = args, func.__name__
+
+                positional = ', '.join((["self"] if bound else []) + [argument_repr(arg) for arg in call_args])
+                keyword = ', '.join([f'{name}={argument_repr(val)}' for name, val in kwargs.items()])
+                arguments = f"{positional}{f', ' if positional and keyword else ''}{keyword}"
+
+                log.debug(f"{func_name}({arguments})")
+
+                log.indentation_level += 1
+                try:
+                    with Timer() as timer:
+                        ret = func(*args, **kwargs)
+                finally:
+                    log.indentation_level -= 1
 
-            func_name = func.__name__ if not hasattr(func, "__self__") else f"{type(func.__self__).__name__}.{func.__name__}"
+                log.debug(f"{func_name} [{timer.period:.3f}s] -> {argument_repr(ret)}")
 
-            cls.log.debug(f"{func_name}({arguments})")
+                return ret
 
-            with cls.log.indentation(), Timer() as timer:
-                ret = func(*args, **kwargs)
+            return script_wrapper
 
-            cls.log.debug(f"{func_name} [{timer.period:.3f}s] -> {repr(ret)}")
+        return wrap
 
-            return ret
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _logs_dir(log_location: str) -> Dir:
+        """Resolve (and create) the logs directory for the given location once per process, rather than on every Script construction."""
+        if pathlib.Path(log_location).is_absolute():
+            return Dir(log_location)
 
-        return script_wrapper
+        return Dir.from_appdata(systemwide=not executed_within_user_tree()).new_dir("python").new_dir("logs").join_dir(log_location)
 
     def _is_valid_function_type(cls, candidate: Any) -> bool:
-        return inspect.isfunction(candidate) or isinstance(candidate, (staticmethod, classmethod))
+        return isinstance(candidate, (FunctionType, staticmethod, classmethod))
 
 
 class Script(ReprMixin, metaclass=ScriptMeta):
@@ -110,4 +146,4 @@ class Script(ReprMixin, metaclass=ScriptMeta):
         pass
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({', '.join([f'{attr}={repr(val)}' for attr, val in self.__dict__.items() if not attr.startswith('_')])})"
+        return f"{type(self).__name__}({', '.join([f'{attr}={val!r}' for attr, val in self.__dict__.items() if not attr.startswith('_')])})"
@@ -3,9 +3,8 @@ from __future__ import annotations
 from collections.abc import MutableSequence, Sequence, MutableMapping, Mapping, MutableSet, Iterable
 import copy
 import os
-from typing import Any
-
-import dill
+import pickle
+from typing import Any, Generator, Optional
 
 from pathmagic import File
 
@@ -23,7 +22,7 @@ class Lost:
         raise StopIteration
 
     def __getattr__(self, name: str) -> Lost:
-        if name.startswith("__") and name.endswith("__"):
+        if name[:2] == "__" == name[-2:]:
             raise AttributeError(name)
         else:
             return self
@@ -49,7 +48,7 @@ class LostObject:
         raise StopIteration
 
     def __getattr__(self, name: str) -> Lost:
-        if name.startswith("__") and name.endswith("__"):
+        if name[:2] == "__" == name[-2:]:
             raise AttributeError(name)
         else:
             return self.lost
@@ -76,7 +75,16 @@ class Serializer:
             return None
 
     def to_bytes(self, obj: Any, **kwargs: Any) -> bytes:
-        """Serialize the given object to bytes."""
+        """Serialize the given object to bytes. Objects the standard library pickler can handle are never passed to dill, unless they reference '__main__', which only dill stores by value."""
+        if not kwargs:
+            try:
+                if b"__main__" not in (data := pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)):
+                    return data
+            except Exception:
+                pass
+
+        import dill
+
         try:
             return dill.dumps(obj, **kwargs)
         except Exception:
@@ -85,97 +93,120 @@ class Serializer:
 
     def from_bytes(self, text: bytes, **kwargs: Any) -> Any:
         """Deserialize the given object from bytes."""
+        import dill
+
         return dill.loads(text, **kwargs)
 
 
 class UnpickleableItemHelper:
     """A helper class used to pickle objects with unpickleable components by discarding those components and preserving the rest."""
+    _always_pickleable = frozenset({int, float, complex, bool, str, bytes, bytearray, type(None)})
 
     def __init__(self, item: Any) -> None:
-        self.item, self.copy, self.seen = item, None, {}
+        self.item, self.seen = item, {}
 
     def serializable_copy(self) -> Any:
         self.seen.clear()
 
         try:
-            self.copy = copy.copy(self.item)
-            self.seen[id(self.item)] = self.copy
-            return self.recursively_strip_invalid(self.copy)
+            return self.recursively_strip_invalid(self.item)
         except Exception:
             return LostObject(self.item)
 
     def recursively_strip_invalid(self, obj) -> Any:
-        if obj is self.item:
-            return self.copy
+        """Strip the graph below the given object. Nested objects are resolved on an explicit stack of suspended handlers rather than on the call stack, so deep nesting cannot exhaust the recursion limit."""
+        value, handler = self.visit(obj)
+        stack = [] if handler is None else [(obj, handler)]
+
+        while stack:
+            node, handler = stack[-1]
+            try:
+                child = handler.send(value)
+            except StopIteration as finished:
+                stack.pop()
+                value = self.seen[id(node)] = finished.value
+            else:
+                value, handler = self.visit(child)
+                if handler is not None:
+                    stack.append((child, handler))
+
+        return value
+
+    def visit(self, obj) -> tuple[Any, Optional[Generator]]:
+        if (key := id(obj)) in self.seen:
+            return self.seen[key], None
 
         if self.is_endpoint(obj):
-            if id(obj) in self.seen:
-                return self.seen[id(obj)]
-            else:
-                ret = obj if self.is_pickleable(obj) else LostObject(obj)
-                self.seen[id(obj)] = ret
-                return ret
-        else:
-            return self.handle_non_endpoint(obj)
+            ret = self.seen[key] = obj if self.is_pickleable(obj) else LostObject(obj)
+            return ret, None
+
+        return self.handle_non_endpoint(obj)
 
-    def handle_non_endpoint(self, obj):
+    def handle_non_endpoint(self, obj) -> tuple[Any, Optional[Generator]]:
         try:
-            shallow_copy = obj if obj is self.copy else copy.copy(obj)
+            shallow_copy = copy.copy(obj)
         except Exception:
-            ret = LostObject(obj)
-            self.seen[id(obj)] = ret
-            return ret
+            ret = self.seen[id(obj)] = LostObject(obj)
+            return ret, None
         else:
-            self.seen[id(obj)] = shallow_copy
-            return self.handle_shallow_copy(shallow_copy)
+            # immutable containers are only rebuilt once their children are done, so a cycle back into one cannot be honoured
+            self.seen[id(obj)] = LostObject(obj) if shallow_copy is obj else shallow_copy
+            return None, self.handle_shallow_copy(shallow_copy)
 
-    def handle_shallow_copy(self, obj):
+    def handle_shallow_copy(self, obj) -> Generator:
         return self.handle_object(obj) if hasattr(obj, "__dict__") else self.handle_iterable(obj)
 
-    def handle_object(self, obj):
-        for key, val in vars(obj).items():
-            setattr(obj, key, self.recursively_strip_invalid(val))
+    def handle_object(self, obj) -> Generator:
+        for key, val in obj.__dict__.items():
+            setattr(obj, key, (yield val))
 
         return obj
 
-    def handle_iterable(self, obj):
-        if isinstance(obj, MutableMapping):
-            new_dict = {self.recursively_strip_invalid(key): self.recursively_strip_invalid(val) for key, val in obj.items()}
-            obj.clear()
-            obj.update(new_dict)
-        elif isinstance(obj, Mapping):
-            new = type(obj)({self.recursively_strip_invalid(key) : self.recursively_strip_invalid(val) for key, val in obj.items()})
-            for key, val in self.seen.items():
-                if val is obj:
-                    self.seen[key] = new
-                    break
-
-            obj = new
+    def handle_iterable(self, obj) -> Generator:
+        if isinstance(obj, Mapping):
+            new_dict = {}
+            for key, val in list(obj.items()):
+                new_key = yield key
+                new_dict[new_key] = yield val
+
+            if isinstance(obj, MutableMapping):
+                obj.clear()
+                obj.update(new_dict)
+            else:
+                obj = type(obj)(new_dict)
         elif isinstance(obj, MutableSet):
-            for val in obj:
-                obj.remove(val)
-                obj.add(self.recursively_strip_invalid(val))
+            values = list(obj)
+            obj.clear()
+            for val in values:
+                obj.add((yield val))
         elif isinstance(obj, MutableSequence):
             for index, val in enumerate(obj):
-                obj[index] = self.recursively_strip_invalid(val)
+                obj[index] = yield val
         elif isinstance(obj, Sequence):
-            new = type(obj)([self.recursively_strip_invalid(val) for val in obj])
-            for key, val in self.seen.items():
-                if val is obj:
-                    self.seen[key] = new
-                    break
+            new_items = []
+            for val in obj:
+                new_items.append((yield val))
 
-            obj = new
+            obj = type(obj)(new_items)
 
         return obj
 
-    @staticmethod
-    def is_pickleable(item: Any) -> bool:
+    @classmethod
+    def is_pickleable(cls, item: Any) -> bool:
+        if type(item) in cls._always_pickleable:
+            return True
+
         try:
-            dill.dumps(item)
+            pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
             return True
         except Exception:
-            return False
+            import dill
+
+            try:
+                dill.dumps(item)
+                return True
+            except Exception:
+                return False
 
     @staticmethod
     def is_endpoint(item: Any) -> bool:
@@ -8,7 +8,6 @@ import decimal
 
 import typepy
 
-from maybe import Maybe
 from subtypes import DateTime, Date, Str, List, Dict
 import pathmagic
 from miscutils import ParametrizableMixin, issubclass_safe, lambda_source
@@ -32,7 +31,7 @@ class Condition:
         self.name = name if name is not None else self.extract_name_from_condition()
 
     def __str__(self) -> str:
-        return Maybe(self.name).else_(self.condition.__name__)
+        return self.name if self.name is not None else self.condition.__name__
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(name={repr(self.name)}, condition={self.condition.__name__})"
@@ -41,7 +40,7 @@ class Condition:
         return self.condition(input_val)
 
     def extract_name_from_condition(self) -> str:
-        return Str(lambda_source(self.condition)).slice.after_first(r":").strip() if self.condition.__name__ == "<lambda>" else self.condition.__name__
+        return lambda_source(self.condition).partition(":")[2].strip() if self.condition.__name__ == "<lambda>" else self.condition.__name__
 
 
 class ValidatorMeta(type):
@@ -57,12 +56,19 @@ class Validator(metaclass=ValidatorMeta):
     type_affinity = None
     converter = None
 
-    def __init__(self, *, nullable: bool = False) -> None:
+    def __init__(self, *, nullable: bool = False, choices: Union[enum.Enum, Iterable] = None,
+                 conditions: Union[Callable, list[Callable], dict[str, Callable]] = None) -> None:
         self.nullable = nullable
-        self.choices: Optional[set] = None
+        self.choices: Optional[list] = None
         self.conditions: list[Condition] = []
         self.converter_kwargs: dict[str, Any] = {}
 
+        if choices is not None:
+            self.set_choices(choices)
+
+        if conditions:
+            self.add_conditions(conditions) if isinstance(conditions, (list, dict)) else self.add_condition(conditions)
+
     def __repr__(self) -> str:
         return f"""{type(self).__name__}({", ".join([f"{attr}={repr(val) if not 'type_affinity' in attr else (None if val is None else val.__name__)}" for attr, val in self.__dict__.items() if not attr.startswith('_')])})"""
 
@@ -87,7 +93,7 @@ class Validator(metaclass=ValidatorMeta):
         return self
 
     def add_conditions(self, conditions: Union[list[Callable], dict[str, Callable]]) -> Validator:
-        self.conditions += [Condition(condition=cond, name=name) for name, cond in conditions.items()] if isinstance(conditions, dict) else [Condition(condition=cond) for cond in conditions]
+        self.conditions.extend((Condition(condition=cond, name=name) for name, cond in conditions.items()) if isinstance(conditions, dict) else (Condition(condition=cond) for cond in conditions))
         return self
 
     def is_valid(self, value: Any) -> bool:
@@ -231,8 +237,8 @@ class ListValidator(ParametrizableValidator):
     """A validator that can handle lists. Item access can be used to create a new validator class that will also validate the type of the list members."""
     type_affinity, converter = list, typepy.List
 
-    def __init__(self, *, nullable: bool = False) -> None:
-        super().__init__(nullable=nullable)
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
         self.deep_type: Optional[Validator] = None
 
     def __str__(self) -> str:
@@ -279,8 +285,8 @@ class DictionaryValidator(ParametrizableValidator):
     """A validator that can handle dicts. Item access can be used to create a new validator class that will also validate the type of the dict's keys and values."""
     type_affinity, converter = dict, typepy.Dictionary
 
-    def __init__(self, *, nullable: bool = False) -> None:
-        super().__init__(nullable=nullable)
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
         self.key_type: Optional[Validator] = None
         self.val_type: Optional[Validator] = None
 
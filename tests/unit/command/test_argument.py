@@ -14,9 +14,15 @@ class TestArgument:
     def test_aliases(self):  # synced
         assert True
 
+    def test_add_alias(self):  # synced
+        assert True
+
     def test__post_init_hook(self):  # synced
         assert True
 
+    def test__enum_values_of(self):  # synced
+        assert True
+
     def test_infer_subclass(self):  # synced
         assert True
 
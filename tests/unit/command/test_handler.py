@@ -1,3 +1,6 @@
+import pytest
+
+
 class TestHandler:
     def test___bool__(self):  # synced
         assert True
@@ -11,6 +14,9 @@ class TestHandler:
     def test_register_name(self):  # synced
         assert True
 
+    def test_invalidate_hierarchy(self):  # synced
+        assert True
+
 
 class TestCommandHandler:
     def test_add_argument(self):  # synced
@@ -19,9 +25,28 @@ class TestCommandHandler:
     def test_add_subhandler(self):  # synced
         assert True
 
-    def test_process(self):  # synced
+    def test_invalidate_hierarchy(self):  # synced
         assert True
 
+    def test_process(self, monkeypatch, tmp_path):  # synced
+        handler_module = pytest.importorskip("iotools.command.handler")
+        dir_type = pytest.importorskip("pathmagic").Dir
+
+        class FakeConfig:
+            def __init__(self, author: str, name: str) -> None:
+                self.dir = dir_type(tmp_path)
+
+        monkeypatch.setattr(handler_module, "Config", FakeConfig)
+        handler = handler_module.CommandHandler("test_process", run_mode=handler_module.RunMode.PROGRAMMATIC)
+
+        handler.process()
+        hierarchy, namespace = handler.hierarchy, handler.shared_namespace
+        namespace["leaked"] = True
+
+        handler.process()
+        assert handler.hierarchy is hierarchy
+        assert handler.shared_namespace is not namespace and "leaked" not in handler.shared_namespace
+
     def test_pre_validate(self):  # synced
         assert True
 
@@ -40,6 +65,12 @@ class TestCommandHandler:
     def test_load_latest_input_config(self):  # synced
         assert True
 
+    def test__cached_new_dir(self):  # synced
+        assert True
+
+    def test__cached_new_file(self):  # synced
+        assert True
+
     def test_determine_shortform_alias(self):  # synced
         assert True
 
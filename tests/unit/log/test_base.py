@@ -5,12 +5,27 @@ class TestLog:
     class TestLogLevel:
         pass
 
+    def test_user(self):  # synced
+        assert True
+
     def test_format_string(self, arg):  # synced
         assert True
 
     def test_formatter(self):  # synced
         assert True
 
+    def test_emit(self):  # synced
+        assert True
+
+    def test_write(self):  # synced
+        assert True
+
+    def test_should_flush(self):  # synced
+        assert True
+
+    def test_flush(self):  # synced
+        assert True
+
     def test_start(self):  # synced
         assert True
 
@@ -2,6 +2,9 @@ class TestBaseNestedLog:
     def test_format_message_line(self):  # synced
         assert True
 
+    def test__intern(self):  # synced
+        assert True
+
     def test_greeting(self):  # synced
         assert True
 
@@ -26,6 +26,9 @@ class TestCache:
     def test_setdefault(self):  # synced
         assert True
 
+    def test_flush(self):  # synced
+        assert True
+
     def test__get_content(self):  # synced
         assert True
 
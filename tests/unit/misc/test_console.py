@@ -26,6 +26,27 @@ class TestConsole:
     def test_print_sep(self):  # synced
         assert True
 
+    def test__init_colorama(self):  # synced
+        assert True
+
+    def test__separator(self):  # synced
+        assert True
+
+    def test__emit(self):  # synced
+        assert True
+
+    def test__clear_sequence(self):  # synced
+        assert True
+
+    def test__redraw_lines(self):  # synced
+        assert True
+
+    def test__menu_header(self):  # synced
+        assert True
+
+    def test__keyreader(self):  # synced
+        assert True
+
     def test__collect_choice(self):  # synced
         assert True
 
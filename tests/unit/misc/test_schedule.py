@@ -1,3 +1,6 @@
+import pytest
+
+
 class TestEnums:
     class TestTimeUnit:
         pass
@@ -6,15 +9,34 @@ class TestEnums:
         pass
 
 
+class TestSlotsReprMixin:
+    def test___repr__(self):  # synced
+        assert True
+
+
 class TestSchedule:
     def test_every(self):  # synced
         assert True
 
+    def test__resolve_scheduler_constructor(self):  # synced
+        assert True
+
+    def test__is_registered(self):  # synced
+        assert True
+
+    def test__job_signature(self):  # synced
+        assert True
+
     def test__register_relative_interval(self):  # synced
         assert True
 
     def test__register_fixed_interval(self):  # synced
-        assert True
+        schedule = pytest.importorskip("iotools.misc.schedule").Schedule()
+        schedule.every.day.do(print)
+        schedule.every.week.do(len)
+
+        explicit_fields = {job.id: {field.name: str(field) for field in job.trigger.fields if not field.is_default} for job in schedule.scheduler.get_jobs()}
+        assert explicit_fields == {"print": {}, "len": {"week": "*"}}
 
 
 class TestFixed:
@@ -19,6 +19,9 @@ class TestScriptMeta:
     def test_script_wrapper(self):  # synced
         assert True
 
+    def test__logs_dir(self):  # synced
+        assert True
+
     def test__is_valid_function_type(self):  # synced
         assert True
 
@@ -1,3 +1,9 @@
+import sys
+import threading
+
+import pytest
+
+
 class TestLost:
     def test___len__(self):  # synced
         assert True
@@ -33,11 +39,31 @@ class TestSerializer:
     def test_deserialize(self):  # synced
         assert True
 
-    def test_to_bytes(self):  # synced
-        assert True
+    def test_to_bytes(self, tmp_path, monkeypatch):  # synced
+        serializer = pytest.importorskip("iotools.misc.serializer").Serializer(tmp_path / "test.pkl")
+        dill = pytest.importorskip("dill")
 
-    def test_from_bytes(self):  # synced
-        assert True
+        assert dill.loads(serializer.to_bytes({"a": [1, 2]})) == {"a": [1, 2]}
+        assert dill.loads(serializer.to_bytes(lambda x: x + 1))(1) == 2
+
+        class Script:
+            pass
+
+        Script.__module__, Script.__qualname__ = "__main__", "Script"
+        monkeypatch.setattr(sys.modules["__main__"], "Script", Script, raising=False)
+        data = serializer.to_bytes(Script())
+
+        monkeypatch.delattr(sys.modules["__main__"], "Script")
+        assert type(dill.loads(data)).__name__ == "Script"
+
+    def test_from_bytes(self, tmp_path):  # synced
+        serializer = pytest.importorskip("iotools.misc.serializer").Serializer(tmp_path / "test.pkl")
+        dill = pytest.importorskip("dill")
+
+        assert serializer.from_bytes(serializer.to_bytes((1, "a"))) == (1, "a")
+        assert serializer.from_bytes(serializer.to_bytes(lambda x: x * 2))(3) == 6
+        assert serializer.from_bytes(dill.dumps({"legacy": True})) == {"legacy": True}
+        assert serializer.from_bytes(serializer.to_bytes([1]), ignore=True) == [1]
 
 
 class TestUnpickleableItemHelper:
@@ -47,6 +73,9 @@ class TestUnpickleableItemHelper:
     def test_recursively_strip_invalid(self):  # synced
         assert True
 
+    def test_visit(self):  # synced
+        assert True
+
     def test_handle_non_endpoint(self):  # synced
         assert True
 
@@ -60,7 +89,12 @@ class TestUnpickleableItemHelper:
         assert True
 
     def test_is_pickleable(self):  # synced
-        assert True
+        helper = pytest.importorskip("iotools.misc.serializer").UnpickleableItemHelper
+
+        assert helper.is_pickleable((1, 2))
+        assert not helper.is_pickleable((threading.Lock(),))
+        assert helper.is_pickleable(frozenset({1}))
+        assert not helper.is_pickleable(threading.Lock())
 
     def test_is_endpoint(self):  # synced
         assert True